@@ -1,18 +1,24 @@
 """
 Vercel Python Serverless Function: Generate audit PDF.
 POST with JSON body {name, email, field, website, problem}
-Returns {pdf: <base64-encoded PDF>}
+Returns the PDF as application/pdf
 """
 from http.server import BaseHTTPRequestHandler
 import json
-import base64
-import os
-import tempfile
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.colors import HexColor
+import functools
+import io
+import textwrap
+from reportlab.lib.colors import Color, HexColor
+from reportlab.lib.rl_accel import fp_str
 from reportlab.lib.utils import simpleSplit
+from reportlab import rl_config
 from reportlab.pdfgen import canvas
 
+# Keep zlib page compression but skip the ASCII85 pass ReportLab layers on
+# top of it. The A85 encoder is pure Python, was about half the render time
+# and only makes the file larger.
+rl_config.useA85 = 0
+
 # === Brand Colors ===
 GREEN      = HexColor("#00ff88")
 CYAN       = HexColor("#00d4ff")
@@ -29,12 +35,57 @@ GREEN_DARK = HexColor("#0a1f14")
 CARD       = HexColor("#111111")
 BLACK      = HexColor("#000000")
 
-W, H = letter
+W, H = 612.0, 792.0  # US Letter
+W_HALF = W / 2
 ML = 70
 MR = W - 70
 CW = MR - ML
+TOTAL_PAGES = 6
 
 LOGO_ASPECT = 551.0 / 1026.0
+# Every Courier glyph advances 600/1000 em, so line width is just a column count
+COURIER_ADVANCE = 0.6
+
+# === Request Limits ===
+# The submission is wrapped, drawn and sent back, so bound it before any of
+# that work starts. The funnel's checklist summary is ~400 chars.
+MAX_BODY_BYTES = 8192
+MAX_PROBLEM_CHARS = 2000
+MAX_NAME_CHARS = 120
+MAX_FIELD_CHARS = 120
+
+# === Page Content ===
+# (value, description, source, color)
+STATS = (
+    ("67%", "of businesses using AI saw 20%+ revenue growth within 12 months", "McKinsey, 2025", CYAN),
+    ("78%", "of leads go cold because businesses take 5+ hours to respond", "InsideSales Research", ORANGE),
+    ("10-15 hrs", "per week saved on average when manual workflows are automated", "HubSpot State of AI", YELLOW),
+)
+
+# (title, description, color); descriptions are str.format()ed with field
+OPPORTUNITIES = (
+    ("Instant Lead Response", "When someone contacts your {field} business, AI responds in under 60 seconds — qualifying, answering questions, and booking calls on your calendar. No more lost leads from slow follow-up.", GREEN),
+    ("Automated Follow-Up Sequences", "Personalized email sequences that nurture leads on autopilot. Each message adapts based on what the lead cares about. Runs 24/7 without you touching it.", CYAN),
+    ("AI-Powered Content System", "Turn one idea into 10 pieces of content across platforms. Blog posts, social media, email newsletters — all generated, scheduled, and posted automatically.", ORANGE),
+    ("Smart Client Dashboard", "Give your clients a real-time dashboard showing results, progress, and ROI. Builds trust, reduces check-in calls, and makes you look incredibly professional.", PURPLE),
+)
+
+# (tag, title, description, color)
+PHASES = (
+    ("WEEK 1-2", "Foundation", "Audit your current tools, set up core integrations, build your AI response system. You'll see results from day one.", GREEN),
+    ("WEEK 3-4", "Automation", "Connect your workflows — lead capture, follow-up sequences, content pipeline. Everything runs without manual input.", CYAN),
+    ("WEEK 5-6", "Optimization", "Analyze what's working, refine messaging, add advanced features. Scale what converts, cut what doesn't.", ORANGE),
+    ("ONGOING", "Growth", "Monthly optimization, new automations as needs evolve, priority support. Your systems get smarter over time.", YELLOW),
+)
+
+# (title, description, color)
+REASONS = (
+    ("We Build Systems, Not Websites", "Most agencies hand you a website and disappear. We build the AI agents, automations, and workflows that actually grow your business.", GREEN),
+    ("AI-First Approach", "Every solution leverages AI from the ground up. Not bolted on — built into the core of how your business operates.", CYAN),
+    ("Results in Weeks, Not Months", "Our phased approach means measurable results within the first 2 weeks. No 6-month timelines with nothing to show.", ORANGE),
+    ("Everything Under One Roof", "AI agents, workflow automation, websites, ads, content systems, dashboards — all from one team that understands how it connects.", PINK),
+    ("You Own Everything", "No vendor lock-in. Everything we build, you own. If you ever want to bring it in-house, you can.", YELLOW),
+)
 
 
 def bg(c):
@@ -73,7 +124,7 @@ def footer(c):
     c.line(ML, 42, MR, 42)
     c.setFont("Courier", 8)
     c.setFillColor(GRAY)
-    c.drawCentredString(W / 2, 26, "blokblokstudio.com | @haynes2va | @blokblokstudio")
+    c.drawCentredString(W_HALF, 26, "blokblokstudio.com | @haynes2va | @blokblokstudio")
 
 
 def badge(c, x, y, text, color):
@@ -88,25 +139,215 @@ def badge(c, x, y, text, color):
     return bw
 
 
-def dashed_card(c, x, y, w, h, border_color):
-    c.setFillColor(CARD)
-    c.setStrokeColor(border_color)
-    c.setLineWidth(1.2)
-    c.setDash(4, 3)
-    c.roundRect(x, y, w, h, 4, fill=1, stroke=1)
-    c.setDash()
+@functools.lru_cache(maxsize=None)
+def rgb_ops(color):
+    """The (fill "rg", stroke "RG") operators for an opaque RGB color.
+
+    Formatted once per color, skipping ReportLab's per-call type dispatch,
+    fp_str formatting and alpha bookkeeping.
+    """
+    rgb = fp_str(color.red, color.green, color.blue)
+    return f"{rgb} rg", f"{rgb} RG"
+
+
+class StatefulCanvas(canvas.Canvas):
+    """Canvas that skips setters which would not change the graphics state.
+
+    ReportLab already tracks the current font, colors and line width, and
+    resets/restores them on showPage and restoreState, so compare against
+    that before emitting another operator. Opaque RGB colors are emitted
+    from rgb_ops() instead of going through Canvas.setFillColor.
+    Operators added with emit() must leave the state as they found it
+    (capture() wraps in q/Q).
+    """
+
+    def setFont(self, psfontname, size, leading=None):
+        if leading is None:
+            leading = size * 1.2
+        if (psfontname, size, leading) != (self._fontname, self._fontsize, self._leading):
+            super().setFont(psfontname, size, leading)
+
+    def setFillColor(self, aColor, alpha=None):
+        if alpha is not None or type(aColor) is not Color or aColor.alpha != 1:
+            super().setFillColor(aColor, alpha)
+        elif aColor != self._fillColorObj:
+            self._fillColorObj = aColor
+            self._code.append(rgb_ops(aColor)[0])
+
+    def setStrokeColor(self, aColor, alpha=None):
+        if alpha is not None or type(aColor) is not Color or aColor.alpha != 1:
+            super().setStrokeColor(aColor, alpha)
+        elif aColor != self._strokeColorObj:
+            self._strokeColorObj = aColor
+            self._code.append(rgb_ops(aColor)[1])
+
+    def setLineWidth(self, width):
+        if width != self._lineWidth:
+            super().setLineWidth(width)
+
+    def drawText(self, aTextObject):
+        super().drawText(aTextObject)
+        # Font and fill changes made inside the text object outlive its ET
+        self._fontname = aTextObject._fontname
+        self._fontsize = aTextObject._fontsize
+        self._leading = aTextObject._leading
+        self._fillColorObj = getattr(aTextObject, "_fillColorObj", self._fillColorObj)
+
+
+def register_fonts(c):
+    # Pin the internal font names (/F2, /F3) so cached operators resolve
+    # to the same fonts in every document.
+    for font in ("Courier-Bold", "Courier"):
+        c._doc.getInternalFontName(font)
+
+
+# Never saved; only used to record content-stream operators for reuse. A
+# plain Canvas, since a StatefulCanvas would drop setters that the canvas
+# the operators are replayed into still needs. Created at import so the
+# Courier metrics and font objects load during cold start, not on the
+# first request.
+_SCRATCH = canvas.Canvas(io.BytesIO(), pagesize=(W, H))
+register_fonts(_SCRATCH)
+
+
+def capture(draw, *args):
+    """Run draw() on the scratch canvas and return (operators, result).
+
+    The operators are wrapped in q/Q so replaying them leaves the target
+    canvas's graphics state untouched.
+    """
+    code = _SCRATCH._code
+    start = len(code)
+    _SCRATCH.saveState()
+    result = draw(_SCRATCH, *args)
+    _SCRATCH.restoreState()
+    ops = "\n".join(code[start:])
+    del code[start:]
+    return ops, result
+
+
+@functools.lru_cache(maxsize=128)
+def fragment(draw, *args):
+    """capture(), memoized so each distinct drawing is rendered only once."""
+    return capture(draw, *args)
+
+
+def emit(c, ops):
+    """Append pre-formatted operators to the page, bypassing the canvas API."""
+    c._code.append(ops)
+
+
+def place(c, x, y, ops):
+    """Emit captured operators with their origin translated to (x, y)."""
+    emit(c, f"q 1 0 0 1 {fp_str(x, y)} cm\n{ops}\nQ")
+
+
+# Canvas.roundRect's Bezier handle length, as a fraction of the corner radius
+ROUND_RECT_HANDLE = 0.4472
+
+
+@functools.lru_cache(maxsize=None)
+def card_template(w, r=4):
+    """Operators for a w-wide dashed card at the origin, height left open.
+
+    Mirrors Canvas.roundRect's Bezier path with the x coordinates formatted
+    once; format() with stroke (an RG operator) and h, h_r = h - r and
+    h_t = h - t, where t is the corner's Bezier handle length.
+    """
+    t = ROUND_RECT_HANDLE * r
+    return "\n".join((
+        rgb_ops(CARD)[0], "{stroke}", "1.2 w", "[4 3] 0 d", "n",
+        f"{fp_str(r)} 0 m",
+        f"{fp_str(w - r)} 0 l",
+        f"{fp_str(w - t)} 0 {fp_str(w, t, w, r)} c",
+        f"{fp_str(w)} {{h_r}} l",
+        f"{fp_str(w)} {{h_t}} {fp_str(w - t)} {{h}} {fp_str(w - r)} {{h}} c",
+        f"{fp_str(r)} {{h}} l",
+        f"{fp_str(t)} {{h}} 0 {{h_t}} 0 {{h_r}} c",
+        f"0 {fp_str(r)} l",
+        f"0 {fp_str(t, t)} 0 {fp_str(r)} 0 c",
+        "h", "B*", "[] 0 d",
+    ))
+
+
+def dashed_card(c, x, y, w, h, border_color, r=4):
+    t = ROUND_RECT_HANDLE * r
+    ops = card_template(w, r).format(
+        stroke=rgb_ops(border_color)[1], h=fp_str(h), h_r=fp_str(h - r), h_t=fp_str(h - t))
+    place(c, x, y, ops)
+
+
+def mono_wrap(text, fontsize, width):
+    """Wrap Courier text to ``width`` points, like simpleSplit but by column.
+
+    Characters outside Courier's encoding are drawn in fallback fonts with
+    other advances, so text containing them is measured by simpleSplit.
+    """
+    try:
+        text.encode("cp1252")
+    except UnicodeEncodeError:
+        return simpleSplit(text, "Courier", fontsize, width)
+    cols = int(width / (fontsize * COURIER_ADVANCE))
+    lines = []
+    for para in text.split("\n"):
+        lines.extend(textwrap.wrap(" ".join(para.split()), cols, break_on_hyphens=False))
+    return lines
+
+
+def card_text(c, x, y, title, title_size, title_color, gap, lines, size, leading):
+    """Card title and body lines as a single BT/ET text object.
+
+    The title baseline is at (x, y); the first body line sits ``gap`` below
+    it and the rest follow at ``leading``.
+    """
+    t = c.beginText(x, y)
+    t.setFont("Courier-Bold", title_size, gap)
+    t.setFillColor(title_color)
+    t.textLine(title)
+    t.setFont("Courier", size, leading)
+    t.setFillColor(GRAY_LIGHT)
+    t.textLines(lines)
+    c.drawText(t)
 
 
 def color_bar(c, x, y, color, w=30, h=3):
     c.setFillColor(color)
-    c.rect(x, y, w, h, fill=1, stroke=0)
+    emit(c, f"n {fp_str(x, y, w, h)} re f*")
 
 
-def generate_pdf(name, email, field, website, problem, output):
-    c = canvas.Canvas(output, pagesize=letter)
-    total_pages = 6
+def draw_stat_card(c, val, desc, source, color):
+    """Stat card hanging below the origin; returns its height."""
+    desc_lines = mono_wrap(desc, 9, CW - 30)
+    card_h = 38 + len(desc_lines) * 12 + 14
+    dashed_card(c, 0, -card_h, CW, card_h, color)
+    color_bar(c, 10, -10, color)
+    card_text(c, 14, -28, val, 16, WHITE, 16, desc_lines, 9, 12)
+    c.setFont("Courier", 7)
+    c.setFillColor(GRAY_DIM)
+    c.drawRightString(CW - 14, -card_h + 8, f"Source: {source}")
+    return card_h
 
-    # PAGE 1: COVER
+
+def opportunity_card_height(desc_lines):
+    return 34 + len(desc_lines) * 11 + 10
+
+
+def opportunity_card(c, x, y, title, desc_lines, color):
+    """Opportunity card hanging below (x, y); returns its height."""
+    card_h = opportunity_card_height(desc_lines)
+    dashed_card(c, x, y - card_h, CW, card_h, color)
+    color_bar(c, x + 10, y - 10, color)
+    card_text(c, x + 14, y - 26, title, 10, WHITE, 16, desc_lines, 8, 11)
+    return card_h
+
+
+def draw_opportunity_card(c, title, desc, color):
+    """Opportunity card hanging below the origin; returns its height."""
+    return opportunity_card(c, 0, 0, title, mono_wrap(desc, 8, CW - 30), color)
+
+
+def static_cover(c):
+    """Page 1 without the name/field lines. Returns the y of the title."""
     bg(c)
     c.setFillColor(GREEN)
     c.rect(0, H - 5, W, 5, fill=1, stroke=0)
@@ -120,90 +361,45 @@ def generate_pdf(name, email, field, website, problem, output):
     c.setLineWidth(1)
     c.roundRect(bx, y, btw + 20, 28, 4, fill=1, stroke=1)
     c.setFillColor(GREEN)
-    c.drawCentredString(W / 2, y + 9, badge_text)
+    c.drawCentredString(W_HALF, y + 9, badge_text)
     y -= 40
     logo_w = 140
     logo_h = draw_logo(c, (W - logo_w) / 2, y - logo_w * LOGO_ASPECT, logo_w)
     y -= logo_h + 50
     c.setFont("Courier-Bold", 16)
     c.setFillColor(WHITE)
-    c.drawCentredString(W / 2, y, "FREE BUSINESS AUDIT")
-    y -= 45
-    c.setFont("Courier-Bold", 28)
-    c.setFillColor(GREEN)
-    c.drawCentredString(W / 2, y, name.upper())
-    y -= 35
-    c.setFont("Courier-Bold", 14)
-    c.setFillColor(WHITE)
-    c.drawCentredString(W / 2, y, field)
-    y -= 35
+    c.drawCentredString(W_HALF, y, "FREE BUSINESS AUDIT")
+    title_y = y
+    y -= 45 + 35 + 35
     c.setStrokeColor(GREEN)
     c.setLineWidth(2)
-    c.line(W / 2 - 60, y, W / 2 + 60, y)
+    c.line(W_HALF - 60, y, W_HALF + 60, y)
     y -= 30
     c.setFont("Courier", 10)
     c.setFillColor(GRAY)
-    c.drawCentredString(W / 2, y, "Custom strategy & automation roadmap")
-    y -= 16
-    c.drawCentredString(W / 2, y, f"Prepared for {name} | {field}")
+    c.drawCentredString(W_HALF, y, "Custom strategy & automation roadmap")
     draw_logo(c, (W - 110) / 2, 80, 110)
     footer(c)
-    c.showPage()
+    return title_y
 
-    # PAGE 2: THE PROBLEM
+
+def static_problem(c):
+    """Page 2 chrome and heading. Returns the y of the field subtitle."""
     bg(c)
-    y = header(c, 2, total_pages)
+    y = header(c, 2, TOTAL_PAGES)
     footer(c)
     badge(c, ML, y, "THE CHALLENGE", RED)
     y -= 46
     c.setFont("Courier-Bold", 24)
     c.setFillColor(WHITE)
     c.drawString(ML, y, "Where You Are Now")
-    y -= 22
-    c.setFont("Courier", 10)
-    c.setFillColor(GRAY)
-    c.drawString(ML, y, f"Based on your audit submission for {field}")
-    y -= 28
-    problem_lines = simpleSplit(f'"{problem}"', "Courier", 10, CW - 30)
-    card_h = 40 + len(problem_lines) * 14
-    dashed_card(c, ML, y - card_h, CW, card_h, RED)
-    color_bar(c, ML + 10, y - 10, RED)
-    c.setFont("Courier-Bold", 9)
-    c.setFillColor(RED)
-    c.drawString(ML + 14, y - 24, "YOUR BIGGEST CHALLENGE")
-    c.setFont("Courier", 10)
-    c.setFillColor(GRAY_LIGHT)
-    for i, line in enumerate(problem_lines):
-        c.drawString(ML + 14, y - 42 - i * 14, line)
-    y -= card_h + 14
-    stats = [
-        ("67%", "of businesses using AI saw 20%+ revenue growth within 12 months", "McKinsey, 2025", CYAN),
-        ("78%", "of leads go cold because businesses take 5+ hours to respond", "InsideSales Research", ORANGE),
-        ("10-15 hrs", "per week saved on average when manual workflows are automated", "HubSpot State of AI", YELLOW),
-    ]
-    for val, desc, source, color in stats:
-        desc_lines = simpleSplit(desc, "Courier", 9, CW - 30)
-        card_h = 38 + len(desc_lines) * 12 + 14
-        if y - card_h < 60:
-            break
-        dashed_card(c, ML, y - card_h, CW, card_h, color)
-        color_bar(c, ML + 10, y - 10, color)
-        c.setFont("Courier-Bold", 16)
-        c.setFillColor(WHITE)
-        c.drawString(ML + 14, y - 28, val)
-        c.setFont("Courier", 9)
-        c.setFillColor(GRAY_LIGHT)
-        for i, line in enumerate(desc_lines):
-            c.drawString(ML + 14, y - 44 - i * 12, line)
-        c.setFont("Courier", 7)
-        c.setFillColor(GRAY_DIM)
-        c.drawRightString(MR - 14, y - card_h + 8, f"Source: {source}")
-        y -= card_h + 12
-    c.showPage()
+    return y - 22
 
-    # PAGE 3: OPPORTUNITIES
+
+def static_opportunities(c):
+    """Page 3 chrome and heading. Returns the y of the first card."""
     bg(c)
-    y = header(c, 3, total_pages)
+    y = header(c, 3, TOTAL_PAGES)
     footer(c)
     badge(c, ML, y, "OPPORTUNITIES", GREEN)
     y -= 46
@@ -214,33 +410,13 @@ def generate_pdf(name, email, field, website, problem, output):
     c.setFont("Courier", 10)
     c.setFillColor(GRAY)
     c.drawString(ML, y, "AI & automation opportunities tailored to your business")
-    y -= 28
-    opportunities = [
-        ("Instant Lead Response", f"When someone contacts your {field} business, AI responds in under 60 seconds — qualifying, answering questions, and booking calls on your calendar. No more lost leads from slow follow-up.", GREEN),
-        ("Automated Follow-Up Sequences", "Personalized email sequences that nurture leads on autopilot. Each message adapts based on what the lead cares about. Runs 24/7 without you touching it.", CYAN),
-        ("AI-Powered Content System", "Turn one idea into 10 pieces of content across platforms. Blog posts, social media, email newsletters — all generated, scheduled, and posted automatically.", ORANGE),
-        ("Smart Client Dashboard", "Give your clients a real-time dashboard showing results, progress, and ROI. Builds trust, reduces check-in calls, and makes you look incredibly professional.", PURPLE),
-    ]
-    for title, desc, color in opportunities:
-        desc_lines = simpleSplit(desc, "Courier", 8, CW - 30)
-        card_h = 34 + len(desc_lines) * 11 + 10
-        if y - card_h < 60:
-            break
-        dashed_card(c, ML, y - card_h, CW, card_h, color)
-        color_bar(c, ML + 10, y - 10, color)
-        c.setFont("Courier-Bold", 10)
-        c.setFillColor(WHITE)
-        c.drawString(ML + 14, y - 26, title)
-        c.setFont("Courier", 8)
-        c.setFillColor(GRAY_LIGHT)
-        for i, line in enumerate(desc_lines):
-            c.drawString(ML + 14, y - 42 - i * 11, line)
-        y -= card_h + 10
-    c.showPage()
+    return y - 28
 
-    # PAGE 4: ROADMAP
+
+def static_roadmap(c):
+    """Page 4 without the name/field subtitle. Returns the y of the subtitle."""
     bg(c)
-    y = header(c, 4, total_pages)
+    y = header(c, 4, TOTAL_PAGES)
     footer(c)
     badge(c, ML, y, "YOUR ROADMAP", CYAN)
     y -= 46
@@ -248,36 +424,24 @@ def generate_pdf(name, email, field, website, problem, output):
     c.setFillColor(WHITE)
     c.drawString(ML, y, "The Plan")
     y -= 22
-    c.setFont("Courier", 10)
-    c.setFillColor(GRAY)
-    c.drawString(ML, y, f"A phased approach for {name}'s {field} business")
+    subtitle_y = y
     y -= 28
-    phases = [
-        ("WEEK 1-2", "Foundation", "Audit your current tools, set up core integrations, build your AI response system. You'll see results from day one.", GREEN),
-        ("WEEK 3-4", "Automation", "Connect your workflows — lead capture, follow-up sequences, content pipeline. Everything runs without manual input.", CYAN),
-        ("WEEK 5-6", "Optimization", "Analyze what's working, refine messaging, add advanced features. Scale what converts, cut what doesn't.", ORANGE),
-        ("ONGOING", "Growth", "Monthly optimization, new automations as needs evolve, priority support. Your systems get smarter over time.", YELLOW),
-    ]
-    for tag, title, desc, color in phases:
-        desc_lines = simpleSplit(desc, "Courier", 8, CW - 30)
+    for tag, title, desc, color in PHASES:
+        desc_lines = mono_wrap(desc, 8, CW - 30)
         card_h = 18 + 22 + 14 + len(desc_lines) * 11 + 18
         if y - card_h < 60:
             break
         dashed_card(c, ML, y - card_h, CW, card_h, color)
         badge(c, ML + 12, y - 4, tag, color)
-        c.setFont("Courier-Bold", 11)
-        c.setFillColor(WHITE)
-        c.drawString(ML + 14, y - 42, title)
-        c.setFont("Courier", 8)
-        c.setFillColor(GRAY_LIGHT)
-        for i, line in enumerate(desc_lines):
-            c.drawString(ML + 14, y - 58 - i * 11, line)
+        card_text(c, ML + 14, y - 42, title, 11, WHITE, 16, desc_lines, 8, 11)
         y -= card_h + 10
-    c.showPage()
+    return subtitle_y
 
-    # PAGE 5: WHY US
+
+def static_why_us(c):
+    """Page 5 in full; nothing on it depends on the lead."""
     bg(c)
-    y = header(c, 5, total_pages)
+    y = header(c, 5, TOTAL_PAGES)
     footer(c)
     badge(c, ML, y, "WHY US", PURPLE)
     y -= 46
@@ -289,52 +453,39 @@ def generate_pdf(name, email, field, website, problem, output):
     c.setFillColor(GRAY)
     c.drawString(ML, y, "What makes Blok Blok Studio different")
     y -= 28
-    reasons = [
-        ("We Build Systems, Not Websites", "Most agencies hand you a website and disappear. We build the AI agents, automations, and workflows that actually grow your business.", GREEN),
-        ("AI-First Approach", "Every solution leverages AI from the ground up. Not bolted on — built into the core of how your business operates.", CYAN),
-        ("Results in Weeks, Not Months", "Our phased approach means measurable results within the first 2 weeks. No 6-month timelines with nothing to show.", ORANGE),
-        ("Everything Under One Roof", "AI agents, workflow automation, websites, ads, content systems, dashboards — all from one team that understands how it connects.", PINK),
-        ("You Own Everything", "No vendor lock-in. Everything we build, you own. If you ever want to bring it in-house, you can.", YELLOW),
-    ]
-    for title, desc, color in reasons:
-        desc_lines = simpleSplit(desc, "Courier", 8, CW - 30)
+    for title, desc, color in REASONS:
+        desc_lines = mono_wrap(desc, 8, CW - 30)
         card_h = 30 + len(desc_lines) * 11 + 10
         if y - card_h < 60:
             break
         dashed_card(c, ML, y - card_h, CW, card_h, color)
         color_bar(c, ML + 10, y - 10, color)
-        c.setFont("Courier-Bold", 9)
-        c.setFillColor(WHITE)
-        c.drawString(ML + 14, y - 24, title)
-        c.setFont("Courier", 8)
-        c.setFillColor(GRAY_LIGHT)
-        for i, line in enumerate(desc_lines):
-            c.drawString(ML + 14, y - 38 - i * 11, line)
+        card_text(c, ML + 14, y - 24, title, 9, WHITE, 14, desc_lines, 8, 11)
         y -= card_h + 10
-    c.showPage()
+    return y
 
-    # PAGE 6: CTA
+
+def static_cta(c):
+    """Page 6 without the field line. Returns the y of the field line."""
     bg(c)
-    y = header(c, 6, total_pages)
+    y = header(c, 6, TOTAL_PAGES)
     footer(c)
     logo_w = 160
     logo_h = draw_logo(c, (W - logo_w) / 2, y - logo_w * LOGO_ASPECT - 10, logo_w)
     y -= logo_h + 50
     c.setFont("Courier-Bold", 20)
     c.setFillColor(WHITE)
-    c.drawCentredString(W / 2, y, "Ready to Build")
+    c.drawCentredString(W_HALF, y, "Ready to Build")
     y -= 34
     c.setFont("Courier-Bold", 26)
     c.setFillColor(GREEN)
-    c.drawCentredString(W / 2, y, "Systems That Scale?")
+    c.drawCentredString(W_HALF, y, "Systems That Scale?")
     y -= 24
-    c.setFont("Courier", 10)
-    c.setFillColor(GRAY)
-    c.drawCentredString(W / 2, y, f"Let's talk about what's possible for your {field} business.")
+    field_y = y
     y -= 30
     c.setStrokeColor(GREEN)
     c.setLineWidth(2)
-    c.line(W / 2 - 50, y, W / 2 + 50, y)
+    c.line(W_HALF - 50, y, W_HALF + 50, y)
     y -= 35
     btn_w = 300
     btn_h = 42
@@ -343,9 +494,9 @@ def generate_pdf(name, email, field, website, problem, output):
     c.roundRect(btn_x, y - btn_h, btn_w, btn_h, 4, fill=1, stroke=0)
     c.setFont("Courier-Bold", 12)
     c.setFillColor(BLACK)
-    c.drawCentredString(W / 2, y - 18, "BOOK YOUR FREE DISCOVERY CALL")
+    c.drawCentredString(W_HALF, y - 18, "BOOK YOUR FREE DISCOVERY CALL")
     c.setFont("Courier", 9)
-    c.drawCentredString(W / 2, y - 32, "cal.com/chasehaynes/discovery")
+    c.drawCentredString(W_HALF, y - 32, "cal.com/chasehaynes/discovery")
     y -= btn_h + 14
     c.setFillColor(BLACK)
     c.setStrokeColor(GRAY_DIM)
@@ -353,32 +504,152 @@ def generate_pdf(name, email, field, website, problem, output):
     c.roundRect(btn_x, y - btn_h, btn_w, btn_h, 4, fill=1, stroke=1)
     c.setFont("Courier-Bold", 12)
     c.setFillColor(WHITE)
-    c.drawCentredString(W / 2, y - 18, "VISIT BLOK BLOK STUDIO")
+    c.drawCentredString(W_HALF, y - 18, "VISIT BLOK BLOK STUDIO")
     c.setFont("Courier", 9)
     c.setFillColor(GRAY)
-    c.drawCentredString(W / 2, y - 32, "blokblokstudio.com")
+    c.drawCentredString(W_HALF, y - 32, "blokblokstudio.com")
     y -= btn_h + 14
     c.setFillColor(BLACK)
     c.setStrokeColor(GRAY_DIM)
     c.roundRect(btn_x, y - btn_h, btn_w, btn_h, 4, fill=1, stroke=1)
     c.setFont("Courier-Bold", 12)
     c.setFillColor(WHITE)
-    c.drawCentredString(W / 2, y - 18, "FOLLOW ON INSTAGRAM")
+    c.drawCentredString(W_HALF, y - 18, "FOLLOW ON INSTAGRAM")
     c.setFont("Courier", 9)
     c.setFillColor(GRAY)
-    c.drawCentredString(W / 2, y - 32, "@haynes2va")
+    c.drawCentredString(W_HALF, y - 32, "@haynes2va")
     y -= btn_h + 24
     c.setFont("Courier-Bold", 10)
     c.setFillColor(GREEN)
-    c.drawCentredString(W / 2, y, "Let's build something that works for you.")
+    c.drawCentredString(W_HALF, y, "Let's build something that works for you.")
+    return field_y
+
+
+STATIC_PAGES = (static_cover, static_problem, static_opportunities,
+                static_roadmap, static_why_us, static_cta)
+
+
+def _build_static_template():
+    """Render the lead-independent parts of every page once.
+
+    Returns one (operators, y) pair per page, as produced by capture().
+    """
+    return tuple(capture(draw) for draw in STATIC_PAGES)
+
+
+_TEMPLATE_CACHE = _build_static_template()
+
+
+def stamp_template(c, pg):
+    """Paint the cached static content of page ``pg``; returns its y."""
+    ops, y = _TEMPLATE_CACHE[pg - 1]
+    emit(c, ops)
+    return y
+
+
+def generate_pdf(name, email, field, website, problem, output):
+    c = StatefulCanvas(output, pagesize=(W, H))
+    register_fonts(c)
+
+    # PAGE 1: COVER
+    y = stamp_template(c, 1)
+    y -= 45
+    c.setFont("Courier-Bold", 28)
+    c.setFillColor(GREEN)
+    c.drawCentredString(W_HALF, y, name.upper())
+    y -= 35
+    c.setFont("Courier-Bold", 14)
+    c.setFillColor(WHITE)
+    c.drawCentredString(W_HALF, y, field)
+    y -= 35 + 30 + 16
+    c.setFont("Courier", 10)
+    c.setFillColor(GRAY)
+    c.drawCentredString(W_HALF, y, f"Prepared for {name} | {field}")
+    c.showPage()
+
+    # PAGE 2: THE PROBLEM
+    y = stamp_template(c, 2)
+    c.setFont("Courier", 10)
+    c.setFillColor(GRAY)
+    c.drawString(ML, y, f"Based on your audit submission for {field}")
+    y -= 28
+    problem_lines = mono_wrap(f'"{problem}"', 10, CW - 30)
+    card_h = 40 + len(problem_lines) * 14
+    dashed_card(c, ML, y - card_h, CW, card_h, RED)
+    color_bar(c, ML + 10, y - 10, RED)
+    card_text(c, ML + 14, y - 24, "YOUR BIGGEST CHALLENGE", 9, RED, 18, problem_lines, 10, 14)
+    y -= card_h + 14
+    for val, desc, source, color in STATS:
+        ops, card_h = fragment(draw_stat_card, val, desc, source, color)
+        if y - card_h < 60:
+            break
+        place(c, ML, y, ops)
+        y -= card_h + 12
+    c.showPage()
+
+    # PAGE 3: OPPORTUNITIES
+    y = stamp_template(c, 3)
+    for title, desc, color in OPPORTUNITIES:
+        if "{field}" in desc:
+            # Lead input is drawn here, never on the scratch canvas: glyphs
+            # outside Courier's encoding pull in fallback fonts whose
+            # internal names differ between documents.
+            desc_lines = mono_wrap(desc.format(field=field), 8, CW - 30)
+            card_h = opportunity_card_height(desc_lines)
+            if y - card_h < 60:
+                break
+            opportunity_card(c, ML, y, title, desc_lines, color)
+        else:
+            ops, card_h = fragment(draw_opportunity_card, title, desc, color)
+            if y - card_h < 60:
+                break
+            place(c, ML, y, ops)
+        y -= card_h + 10
+    c.showPage()
+
+    # PAGE 4: ROADMAP
+    y = stamp_template(c, 4)
+    c.setFont("Courier", 10)
+    c.setFillColor(GRAY)
+    c.drawString(ML, y, f"A phased approach for {name}'s {field} business")
+    c.showPage()
+
+    # PAGE 5: WHY US
+    stamp_template(c, 5)
+    c.showPage()
+
+    # PAGE 6: CTA
+    y = stamp_template(c, 6)
+    c.setFont("Courier", 10)
+    c.setFillColor(GRAY)
+    c.drawCentredString(W_HALF, y, f"Let's talk about what's possible for your {field} business.")
     c.showPage()
     c.save()
     return output
 
 
+@functools.lru_cache(maxsize=64)
+def render_pdf(name, field, problem):
+    """The audit PDF as bytes, memoized so resubmits and retries that reach
+    the same warm instance skip rendering.
+
+    Keyed on the drawn fields only; email and website never appear in the
+    document, and are unvalidated values that need not be hashable.
+    """
+    buf = io.BytesIO()
+    generate_pdf(name, None, field, None, problem, buf)
+    return buf.getvalue()
+
+
 class handler(BaseHTTPRequestHandler):
     def do_POST(self):
         content_length = int(self.headers.get('Content-Length', 0))
+        if content_length > MAX_BODY_BYTES:
+            self.send_response(413)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps({'error': 'Request body too large'}).encode())
+            return
         body = json.loads(self.rfile.read(content_length))
 
         # Validate required fields
@@ -395,19 +666,16 @@ class handler(BaseHTTPRequestHandler):
             self.wfile.write(json.dumps({'error': 'Missing required fields'}).encode())
             return
 
-        # Generate PDF to temp file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
-            tmp_path = f.name
+        # Truncate free text before it is wrapped and drawn
+        name = name[:MAX_NAME_CHARS]
+        field = field[:MAX_FIELD_CHARS]
+        problem = str(problem)[:MAX_PROBLEM_CHARS]
 
-        try:
-            generate_pdf(name, email, field, website, problem, tmp_path)
-            with open(tmp_path, 'rb') as f:
-                pdf_bytes = f.read()
-            pdf_b64 = base64.b64encode(pdf_bytes).decode('utf-8')
+        pdf_bytes = render_pdf(name, field, problem)
 
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'pdf': pdf_b64}).encode())
-        finally:
-            os.unlink(tmp_path)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Disposition', 'attachment; filename="audit.pdf"')
+        self.send_header('Content-Length', str(len(pdf_bytes)))
+        self.end_headers()
+        self.wfile.write(pdf_bytes)
@@ -37,8 +37,7 @@ export async function generateAuditPdf(lead: {
     throw new Error(`PDF generation failed (${res.status}): ${errText}`);
   }
 
-  const { pdf } = await res.json();
-  return Buffer.from(pdf, 'base64');
+  return Buffer.from(await res.arrayBuffer());
 }
 
 /**